@@ -16,6 +16,7 @@ from pyramid.util import (
     SimpleSerializer,
     ascii_,
     bytes_,
+    is_nonstr_iter,
     strings_differ,
     text_,
 )
@@ -37,6 +38,29 @@ class CallbackAuthenticationPolicy:
             methodname = classname + '.' + methodname
             logger.debug(methodname + ': ' + msg)
 
+    def _call_callback(self, credential, request):
+        # authenticated_userid and effective_principals both consult the
+        # callback, remember its result in the environ so that a request
+        # only invokes it once per credential
+        environ = request.environ
+        cached = environ.get('pyramid.authentication.callback_result')
+        if (
+            cached is not None
+            and cached[0] is self
+            and cached[1] == credential
+        ):
+            return cached[2]
+        result = self.callback(credential, request)
+        if is_nonstr_iter(result):
+            # the groups may be a generator which can only be consumed once
+            result = list(result)
+        environ['pyramid.authentication.callback_result'] = (
+            self,
+            credential,
+            result,
+        )
+        return result
+
     def _clean_principal(self, princid):
         if princid in (Authenticated, Everyone):
             princid = None
@@ -79,7 +103,7 @@ class CallbackAuthenticationPolicy:
                 request,
             )
             return userid
-        callback_ok = self.callback(userid, request)
+        callback_ok = self._call_callback(userid, request)
         if callback_ok is not None:  # is not None!
             debug and self._log(
                 'groupfinder callback returned %r; returning %r'
@@ -150,7 +174,7 @@ class CallbackAuthenticationPolicy:
             )
             groups = []
         else:
-            groups = self.callback(userid, request)
+            groups = self._call_callback(userid, request)
             debug and self._log(
                 'groupfinder callback returned %r as groups' % (groups,),
                 'effective_principals',
@@ -165,9 +189,7 @@ class CallbackAuthenticationPolicy:
             )
             return effective_principals
 
-        effective_principals.append(Authenticated)
-        effective_principals.append(userid)
-        effective_principals.extend(groups)
+        effective_principals = [Everyone, Authenticated, userid, *groups]
 
         debug and self._log(
             'returning effective principals: %r' % (effective_principals,),
@@ -261,7 +283,7 @@ class RepozeWho1AuthenticationPolicy(CallbackAuthenticationPolicy):
         if self.callback is None:
             return userid
 
-        if self.callback(identity, request) is not None:  # is not None!
+        if self._call_callback(identity, request) is not None:  # is not None!
             return userid
 
     def unauthenticated_userid(self, request):
@@ -302,7 +324,7 @@ class RepozeWho1AuthenticationPolicy(CallbackAuthenticationPolicy):
         if self.callback is None:
             groups = []
         else:
-            groups = self.callback(identity, request)
+            groups = self._call_callback(identity, request)
 
         if groups is None:  # is None!
             self.debug and self._log(
@@ -339,9 +361,7 @@ class RepozeWho1AuthenticationPolicy(CallbackAuthenticationPolicy):
             )
             return effective_principals
 
-        effective_principals.append(Authenticated)
-        effective_principals.append(userid)
-        effective_principals.extend(groups)
+        effective_principals = [Everyone, Authenticated, userid, *groups]
         return effective_principals
 
     def remember(self, request, userid, **kw):
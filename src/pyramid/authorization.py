@@ -1,3 +1,5 @@
+import sys
+import threading
 import warnings
 from zope.interface import implementer
 
@@ -45,6 +47,200 @@ class ACLDenied(_ACLDenied):
 ALL_PERMISSIONS = AllPermissionsList()  # api
 DENY_ALL = (Deny, Everyone, ALL_PERMISSIONS)  # api
 
+# compiled forms of ACLs which have been seen more than once, keyed by
+# ``id(acl)``; each entry holds a strong reference to the ACL so the id cannot
+# be reused while it is cached
+_acl_cache = {}
+_acl_cache_lock = threading.Lock()
+_ACL_CACHE_MAX = 1000
+
+# ACLs which have been seen once, keyed by ``id(acl)``; an ACL is only
+# compiled when it is seen again, so an ``__acl__`` which builds a new list on
+# every access is never compiled and never displaces the entries above
+_acl_candidates = {}
+_ACL_CANDIDATES_MAX = 100
+
+
+def _normalize_permissions(permissions):
+    # permissions are almost always a str or a tuple of them, which are
+    # indexed; anything else, including lists and custom containers such as
+    # ALL_PERMISSIONS, is consulted directly so its membership is current
+    permissions_type = type(permissions)
+    if permissions_type is str:
+        return frozenset((permissions,))
+    if permissions_type is tuple:
+        return frozenset(permissions)
+    if is_nonstr_iter(permissions):
+        return permissions
+    return (permissions,)
+
+
+def _compile_acl(acl):
+    """Return a :class:`_CompiledACL` for ``acl`` or ``None`` if any of its
+    ACEs cannot be compiled.  Such an ACL is evaluated one ACE at a time, so
+    that a malformed ACE is only an error once it is reached.
+
+    Only ``tuple`` ACEs are compiled: the cache only detects changes to the
+    ACL itself, and an ACE which is a list (as loaded from JSON, say) may be
+    modified in place.
+
+    """
+    compiled = []
+    try:
+        for ace in acl:
+            if type(ace) is not tuple:
+                return None
+            ace_action, ace_principal, ace_permissions = ace
+            if type(ace_action) is str:
+                # actions are nearly always Allow or Deny, which are interned
+                ace_action = sys.intern(ace_action)
+            compiled.append(
+                (
+                    ace,
+                    ace_action,
+                    ace_principal,
+                    _normalize_permissions(ace_permissions),
+                )
+            )
+    except (TypeError, ValueError):
+        return None
+    return _CompiledACL(tuple(compiled))
+
+
+class _CompiledACL:
+    # an upper bound on the number of distinct permissions indexed per ACL
+    max_indexed_permissions = 100
+
+    def __init__(self, entries):
+        self.entries = entries
+        self._by_permission = {}
+
+    def for_permission(self, permission):
+        """Return the entries which may match ``permission``, in ACL order,
+        or ``None`` if ``permission`` cannot be indexed.
+
+        Entries whose permissions are consulted directly (lists, sets or
+        custom containers) are always included and must be tested again by
+        the caller.
+
+        """
+        try:
+            return self._by_permission[permission]
+        except KeyError:
+            pass
+        except TypeError:
+            # an unhashable permission
+            return None
+        candidates = tuple(
+            entry
+            for entry in self.entries
+            if not isinstance(entry[3], frozenset) or permission in entry[3]
+        )
+        if len(self._by_permission) < self.max_indexed_permissions:
+            self._by_permission[permission] = candidates
+        return candidates
+
+
+def _get_compiled_acl(acl):
+    """Return the :class:`_CompiledACL` for ``acl``, its ``entries`` are
+    ``(ace, action, principal, permissions)`` tuples where ``permissions``
+    supports fast membership tests.  Return ``None`` if ``acl`` should be
+    evaluated one ACE at a time instead.
+
+    Only plain ``list`` and ``tuple`` ACLs are compiled, once they have been
+    seen a second time, and they are reused until they are modified.
+
+    """
+    acl_type = type(acl)
+    if acl_type is not tuple and acl_type is not list:
+        return None
+    key = id(acl)
+    entry = _acl_cache.get(key)
+    if entry is not None and entry[0] is acl and entry[1] == acl:
+        return entry[2]
+    if _acl_candidates.pop(key, None) is not acl:
+        # seen for the first time (or modified since it was cached)
+        if len(_acl_candidates) >= _ACL_CANDIDATES_MAX:
+            _acl_candidates.clear()
+        _acl_candidates[key] = acl
+        return None
+    compiled = _compile_acl(acl)
+    snapshot = acl if acl_type is tuple else list(acl)
+    with _acl_cache_lock:
+        if key not in _acl_cache and len(_acl_cache) >= _ACL_CACHE_MAX:
+            # evict the oldest entry
+            _acl_cache.pop(next(iter(_acl_cache)), None)
+        _acl_cache[key] = (acl, snapshot, compiled)
+    return compiled
+
+
+def _acl_entries(acl, permission):
+    """Return ``(acl, entries)`` where ``entries`` are the compiled ACEs of
+    ``acl`` which may match ``permission``, or ``None`` if ``acl`` must be
+    evaluated one ACE at a time.  A callable ``acl`` is called first and the
+    ACL it returns is used instead.
+
+    """
+    if acl and callable(acl):
+        # a callable may build a new ACL on every call, don't cache it
+        return acl(), None
+    compiled = _get_compiled_acl(acl)
+    if compiled is None:
+        return acl, None
+    return acl, compiled.for_permission(permission)
+
+
+def _iter_acl(acl):
+    """Yield the ``(ace, action, principal, permissions)`` entries of an ACL
+    which has not been compiled."""
+    for ace in acl:
+        ace_action, ace_principal, ace_permissions = ace
+        if not is_nonstr_iter(ace_permissions):
+            ace_permissions = [ace_permissions]
+        yield ace, ace_action, ace_principal, ace_permissions
+
+
+def _evaluate_acl(
+    acl, entries, location, permission, principals, principal_set
+):
+    """Return an :class:`ACLAllowed` or :class:`ACLDenied` for the first
+    entry matching ``permission`` and any of ``principal_set``, or ``None``
+    if no entry matches.  If ``entries`` is ``None`` the ACEs of ``acl`` are
+    unpacked as they are reached.
+
+    """
+    if entries is None:
+        for ace in acl:
+            ace_action, ace_principal, ace_permissions = ace
+            if ace_principal in principal_set:
+                if not is_nonstr_iter(ace_permissions):
+                    ace_permissions = [ace_permissions]
+                if permission in ace_permissions:
+                    if ace_action == Allow:
+                        return ACLAllowed(
+                            ace, acl, permission, principals, location
+                        )
+                    return ACLDenied(
+                        ace, acl, permission, principals, location
+                    )
+        return None
+    for ace, ace_action, ace_principal, ace_permissions in entries:
+        if ace_principal in principal_set and permission in ace_permissions:
+            if ace_action == Allow:
+                return ACLAllowed(ace, acl, permission, principals, location)
+            return ACLDenied(ace, acl, permission, principals, location)
+    return None
+
+
+def _allows_everyone(entry, permission, principals):
+    ace, ace_action, ace_principal, ace_permissions = entry
+    return (
+        ace_principal == Everyone
+        and ace_action == Allow
+        and permission in ace_permissions
+        and Everyone in principals
+    )
+
 
 @implementer(IAuthorizationPolicy)
 class ACLAuthorizationPolicy:
@@ -120,30 +316,50 @@ class ACLHelper:
 
         """
         acl = '<No ACL found on any object in resource lineage>'
-
-        for location in lineage(context):
+        principal_set = None
+
+        # walk the lineage inline rather than through the lineage()
+        # generator, this is called for every permission check
+        location = context
+        while location is not None:
+            # most locations have no ACL, so avoid raising and catching an
+            # AttributeError for each of them
+            location_acl = getattr(location, '__acl__', None)
+            if location_acl is not None:
+                acl, entries = _acl_entries(location_acl, permission)
+                if principal_set is None:
+                    # fast path for the common case of a resource whose ACL
+                    # starts by granting the permission to Everyone
+                    if entries and _allows_everyone(
+                        entries[0], permission, principals
+                    ):
+                        return ACLAllowed(
+                            entries[0][0],
+                            acl,
+                            permission,
+                            principals,
+                            location,
+                        )
+                    # build the membership set once per call rather than
+                    # scanning the principals sequence for every ACE in every
+                    # ACL in the lineage
+                    principal_set = frozenset(principals)
+                result = _evaluate_acl(
+                    acl,
+                    entries,
+                    location,
+                    permission,
+                    principals,
+                    principal_set,
+                )
+                if result is not None:
+                    return result
+
+            # see lineage() for why an exception is used here
             try:
-                acl = location.__acl__
+                location = location.__parent__
             except AttributeError:
-                continue
-
-            if acl and callable(acl):
-                acl = acl()
-
-            for ace in acl:
-                ace_action, ace_principal, ace_permissions = ace
-                if ace_principal in principals:
-                    if not is_nonstr_iter(ace_permissions):
-                        ace_permissions = [ace_permissions]
-                    if permission in ace_permissions:
-                        if ace_action == Allow:
-                            return ACLAllowed(
-                                ace, acl, permission, principals, location
-                            )
-                        else:
-                            return ACLDenied(
-                                ace, acl, permission, principals, location
-                            )
+                location = None
 
         # default deny (if no ACL in lineage at all, or if none of the
         # principals were mentioned in any ACE we found)
@@ -151,6 +367,66 @@ class ACLHelper:
             '<default deny>', acl, permission, principals, context
         )
 
+    def permits_many(self, contexts, principals, permission):
+        """Return a list containing the result of :meth:`.permits` for each
+        of ``contexts``, in the same order.
+
+        This is equivalent to calling :meth:`.permits` once per context, but
+        the ACL of a location shared by several of the contexts, such as the
+        parent of a folder's children, is evaluated only once.
+
+        .. versionadded:: 2.0
+
+        """
+        principal_set = frozenset(principals)
+
+        # (location, acl, result) for every location evaluated so far, keyed
+        # by id(location); the location is kept so that the id of a location
+        # which has been garbage collected cannot be mistaken for another
+        evaluated = {}
+        results = []
+
+        for context in contexts:
+            acl = '<No ACL found on any object in resource lineage>'
+            result = None
+            location = context
+            while location is not None:
+                cached = evaluated.get(id(location))
+                if cached is not None and cached[0] is location:
+                    location_acl, result = cached[1], cached[2]
+                else:
+                    location_acl = getattr(location, '__acl__', None)
+                    if location_acl is not None:
+                        location_acl, entries = _acl_entries(
+                            location_acl, permission
+                        )
+                        result = _evaluate_acl(
+                            location_acl,
+                            entries,
+                            location,
+                            permission,
+                            principals,
+                            principal_set,
+                        )
+                    evaluated[id(location)] = (location, location_acl, result)
+                if location_acl is not None:
+                    acl = location_acl
+                if result is not None:
+                    break
+
+                try:
+                    location = location.__parent__
+                except AttributeError:
+                    location = None
+
+            if result is None:
+                result = ACLDenied(
+                    '<default deny>', acl, permission, principals, context
+                )
+            results.append(result)
+
+        return results
+
     def principals_allowed_by_permission(self, context, permission):
         """Return the set of principals explicitly granted the permission
         named ``permission`` according to the ACL directly attached to the
@@ -177,24 +453,24 @@ class ACLHelper:
 
         for location in reversed(list(lineage(context))):
             # NB: we're walking *up* the object graph from the root
-            try:
-                acl = location.__acl__
-            except AttributeError:
+            acl = getattr(location, '__acl__', None)
+            if acl is None:
                 continue
 
             allowed_here = set()
             denied_here = set()
 
-            if acl and callable(acl):
-                acl = acl()
+            acl, entries = _acl_entries(acl, permission)
+            if entries is None:
+                entries = _iter_acl(acl)
 
-            for ace_action, ace_principal, ace_permissions in acl:
-                if not is_nonstr_iter(ace_permissions):
-                    ace_permissions = [ace_permissions]
-                if (ace_action == Allow) and (permission in ace_permissions):
+            for _, ace_action, ace_principal, ace_permissions in entries:
+                if permission not in ace_permissions:
+                    continue
+                if ace_action == Allow:
                     if ace_principal not in denied_here:
                         allowed_here.add(ace_principal)
-                if (ace_action == Deny) and (permission in ace_permissions):
+                elif ace_action == Deny:
                     denied_here.add(ace_principal)
                     if ace_principal == Everyone:
                         # clear the entire allowed set, as we've hit a
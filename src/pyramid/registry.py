@@ -49,6 +49,8 @@ class Registry(Components, dict):
         self._lock = threading.Lock()
         # add a view lookup cache
         self._clear_view_lookup_cache()
+        # add a cache for utilities looked up on every request
+        self._clear_utility_lookup_cache()
         if package_name is CALLER_PACKAGE:
             package_name = caller_package().__name__
         Components.__init__(self, package_name, *args, **kw)
@@ -57,6 +59,20 @@ class Registry(Components, dict):
     def _clear_view_lookup_cache(self):
         self._view_lookup_cache = {}
 
+    def _clear_utility_lookup_cache(self):
+        self._utility_lookup_cache = {}
+        self._utility_lookup_generation = None
+
+    def _get_utility_lookup_cache(self):
+        # the adapter registry starts a new generation whenever a utility is
+        # registered or unregistered here or in any of our bases, or when
+        # the bases change, so discard the cache whenever that happens
+        generation = self.utilities._generation
+        if generation != self._utility_lookup_generation:
+            self._clear_utility_lookup_cache()
+            self._utility_lookup_generation = generation
+        return self._utility_lookup_cache
+
     def __bool__(self):
         # defeat bool determination via dict.__len__
         return True
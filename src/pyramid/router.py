@@ -1,3 +1,4 @@
+import logging
 from zope.interface import implementer, providedBy
 
 from pyramid.events import (
@@ -60,11 +61,18 @@ class Router:
         request.request_iface = IRequest
         context = None
         routes_mapper = self.routes_mapper
-        debug_routematch = self.debug_routematch
         adapters = registry.adapters
         has_listeners = registry.has_listeners
         notify = registry.notify
         logger = self.logger
+        debug_routematch = self.debug_routematch and logger is not None
+        if debug_routematch:
+            # the route match messages are only ever logged, don't format
+            # them unless the logger will emit them; an IDebugLogger is only
+            # required to provide debug()
+            is_enabled_for = getattr(logger, 'isEnabledFor', None)
+            if is_enabled_for is not None:
+                debug_routematch = is_enabled_for(logging.DEBUG)
 
         has_listeners and notify(NewRequest(request))
         # find the root object
@@ -75,7 +83,7 @@ class Router:
             if route is None:
                 if debug_routematch:
                     msg = 'no route matched for url %s' % request.url
-                    logger and logger.debug(msg)
+                    logger.debug(msg)
             else:
                 attrs['matchdict'] = match
                 attrs['matched_route'] = route
@@ -97,7 +105,7 @@ class Router:
                             ', '.join([p.text() for p in route.predicates]),
                         )
                     )
-                    logger and logger.debug(msg)
+                    logger.debug(msg)
 
                 request.request_iface = registry.queryUtility(
                     IRouteRequest, name=route.name, default=IRequest
@@ -1,3 +1,4 @@
+import sys
 from zope.deprecation import deprecated
 from zope.interface import implementer, providedBy
 
@@ -13,9 +14,22 @@ from pyramid.threadlocal import get_current_registry
 
 NO_PERMISSION_REQUIRED = '__no_permission_required__'
 
+_marker = object()
+
 
 def _get_security_policy(request):
-    return request.registry.queryUtility(ISecurityPolicy)
+    registry = request.registry
+    get_cache = getattr(registry, '_get_utility_lookup_cache', None)
+    if get_cache is None:
+        # not a pyramid.registry.Registry
+        return registry.queryUtility(ISecurityPolicy)
+    cache = get_cache()
+    policy = cache.get(ISecurityPolicy, _marker)
+    if policy is _marker:
+        policy = cache[ISecurityPolicy] = registry.queryUtility(
+            ISecurityPolicy
+        )
+    return policy
 
 
 def remember(request, userid, **kw):
@@ -52,7 +66,9 @@ def remember(request, userid, **kw):
     policy = _get_security_policy(request)
     if policy is None:
         return []
-    return policy.remember(request, userid, **kw)
+    headers = policy.remember(request, userid, **kw)
+    _clear_view_permits_cache(request)
+    return headers
 
 
 def forget(request, **kw):
@@ -77,7 +93,15 @@ def forget(request, **kw):
     policy = _get_security_policy(request)
     if policy is None:
         return []
-    return policy.forget(request, **kw)
+    headers = policy.forget(request, **kw)
+    _clear_view_permits_cache(request)
+    return headers
+
+
+def _clear_view_permits_cache(request):
+    # the decisions remembered by secured views were made for the identity
+    # of the request before it was changed
+    request.__dict__.pop('_view_permits_cache', None)
 
 
 def principals_allowed_by_permission(context, permission):
@@ -356,22 +380,43 @@ class LegacySecurityPolicy:
 
     """
 
+    def __init__(self):
+        # avoid a circular import
+        from pyramid.request import RequestLocalCache
+
+        # the authentication policy is consulted at most once per request
+        self._userid_cache = RequestLocalCache(self._load_userid)
+        self._principals_cache = RequestLocalCache(self._load_principals)
+
     def _get_authn_policy(self, request):
         return request.registry.getUtility(IAuthenticationPolicy)
 
     def _get_authz_policy(self, request):
         return request.registry.getUtility(IAuthorizationPolicy)
 
+    def _load_userid(self, request):
+        authn = self._get_authn_policy(request)
+        return authn.authenticated_userid(request)
+
+    def _load_principals(self, request):
+        authn = self._get_authn_policy(request)
+        return authn.effective_principals(request)
+
+    def _clear_caches(self, request):
+        self._userid_cache.clear(request)
+        self._principals_cache.clear(request)
+
     def authenticated_identity(self, request):
         return self.authenticated_userid(request)
 
     def authenticated_userid(self, request):
-        authn = self._get_authn_policy(request)
-        return authn.authenticated_userid(request)
+        return self._userid_cache.get_or_create(request)
 
     def remember(self, request, userid, **kw):
         authn = self._get_authn_policy(request)
-        return authn.remember(request, userid, **kw)
+        headers = authn.remember(request, userid, **kw)
+        self._clear_caches(request)
+        return headers
 
     def forget(self, request, **kw):
         if kw:
@@ -380,19 +425,22 @@ class LegacySecurityPolicy:
                 'arguments for `forget`'
             )
         authn = self._get_authn_policy(request)
-        return authn.forget(request)
+        headers = authn.forget(request)
+        self._clear_caches(request)
+        return headers
 
     def permits(self, request, context, permission):
-        authn = self._get_authn_policy(request)
         authz = self._get_authz_policy(request)
-        principals = authn.effective_principals(request)
+        principals = self._principals_cache.get_or_create(request)
         return authz.permits(context, principals, permission)
 
 
-Everyone = 'system.Everyone'
-Authenticated = 'system.Authenticated'
-Allow = 'Allow'
-Deny = 'Deny'
+# interned so that comparisons against the constants themselves, or against
+# ACEs compiled by pyramid.authorization, succeed on the identity check
+Everyone = sys.intern('system.Everyone')
+Authenticated = sys.intern('system.Authenticated')
+Allow = sys.intern('Allow')
+Deny = sys.intern('Deny')
 
 
 class AllPermissionsList:
@@ -53,7 +53,14 @@ def ascii_(s):
     return str(s, 'ascii', 'strict')
 
 
+# the builtin containers which are tested before falling back to hasattr(),
+# which raises and suppresses an AttributeError for every non-iterable value
+_ITER_TYPES = (list, tuple, set, frozenset)
+
+
 def is_nonstr_iter(v):
+    if isinstance(v, _ITER_TYPES):
+        return True
     if isinstance(v, str):
         return False
     return hasattr(v, '__iter__')
@@ -62,6 +69,8 @@ def is_nonstr_iter(v):
 def is_string_or_iterable(v):
     if isinstance(v, str):
         return True
+    if isinstance(v, _ITER_TYPES):
+        return True
     if hasattr(v, '__iter__'):
         return True
 
@@ -292,6 +292,22 @@ def secured_view(view, info):
 secured_view.options = ('permission',)
 
 
+def _permits(policy, request, context, permission):
+    # the view machinery may check the same permission against the same
+    # context more than once per request (debug_authorization, MultiView,
+    # view_execution_permitted), so remember the decision on the request
+    if request is None:
+        return policy.permits(request, context, permission)
+    cache = request.__dict__.setdefault('_view_permits_cache', {})
+    key = (id(context), permission)
+    entry = cache.get(key)
+    if entry is not None and entry[0] is context:
+        return entry[1]
+    result = policy.permits(request, context, permission)
+    cache[key] = (context, result)
+    return result
+
+
 def _secured_view(view, info):
     permission = explicit_val = info.options.get('permission')
     if permission is None:
@@ -311,7 +327,7 @@ def _secured_view(view, info):
     if policy and (permission is not None):
 
         def permitted(context, request):
-            return policy.permits(request, context, permission)
+            return _permits(policy, request, context, permission)
 
         def secured_view(context, request):
             result = permitted(context, request)
@@ -357,7 +373,7 @@ def _authdebug_view(view, info):
                 elif permission is None:
                     msg = 'Allowed (no permission registered)'
                 else:
-                    result = policy.permits(request, context, permission)
+                    result = _permits(policy, request, context, permission)
                     msg = str(result)
             else:
                 msg = 'Allowed (no security policy in use)'
@@ -197,6 +197,44 @@ class TestCallbackAuthenticationPolicyDebugging(unittest.TestCase):
             "['system.Everyone', 'system.Authenticated', 'fred']",
         )
 
+    def test_callback_called_once_per_request(self):
+        request = DummyRequest(registry=self.config.registry)
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return ['group']
+
+        policy = self._makeOne(userid='fred', callback=callback)
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(
+            policy.effective_principals(request),
+            ['system.Everyone', 'system.Authenticated', 'fred', 'group'],
+        )
+        self.assertEqual(calls, ['fred'])
+
+        other_policy = self._makeOne(userid='fred', callback=callback)
+        other_policy.authenticated_userid(request)
+        self.assertEqual(calls, ['fred', 'fred'])
+
+        policy.authenticated_userid(
+            DummyRequest(registry=self.config.registry)
+        )
+        self.assertEqual(calls, ['fred', 'fred', 'fred'])
+
+    def test_callback_returns_generator(self):
+        request = DummyRequest(registry=self.config.registry)
+
+        def callback(userid, request):
+            return (group for group in ['group'])
+
+        policy = self._makeOne(userid='fred', callback=callback)
+        for i in range(2):
+            self.assertEqual(
+                policy.effective_principals(request),
+                ['system.Everyone', 'system.Authenticated', 'fred', 'group'],
+            )
+
     def test_effective_principals_with_unclean_principal_Authenticated(self):
         request = DummyRequest(registry=self.config.registry)
         policy = self._makeOne(userid='system.Authenticated')
@@ -304,6 +342,46 @@ class TestRepozeWho1AuthenticationPolicy(unittest.TestCase):
         policy = self._makeOne(callback=callback)
         self.assertEqual(policy.authenticated_userid(request), 'fred')
 
+    def test_callback_called_once_per_identity(self):
+        from pyramid.authorization import Authenticated, Everyone
+
+        identity = {'repoze.who.userid': 'fred'}
+        request = DummyRequest({'repoze.who.identity': identity})
+        calls = []
+
+        def callback(identity, request):
+            calls.append(identity)
+            return ['agroup']
+
+        policy = self._makeOne(callback=callback)
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(
+            policy.effective_principals(request),
+            [Everyone, Authenticated, 'fred', 'agroup'],
+        )
+        self.assertEqual(calls, [identity])
+
+        other = {'repoze.who.userid': 'bob'}
+        request.environ['repoze.who.identity'] = other
+        self.assertEqual(policy.authenticated_userid(request), 'bob')
+        self.assertEqual(calls, [identity, other])
+
+    def test_callback_returns_generator(self):
+        from pyramid.authorization import Authenticated, Everyone
+
+        identity = {'repoze.who.userid': 'fred'}
+        request = DummyRequest({'repoze.who.identity': identity})
+
+        def callback(identity, request):
+            return (group for group in ['agroup'])
+
+        policy = self._makeOne(callback=callback)
+        for i in range(2):
+            self.assertEqual(
+                policy.effective_principals(request),
+                [Everyone, Authenticated, 'fred', 'agroup'],
+            )
+
     def test_authenticated_userid_unclean_principal_Authenticated(self):
         request = DummyRequest(
             {
@@ -192,6 +192,20 @@ class TestACLAuthorizationPolicy(unittest.TestCase):
         # of against ['read_it']
         self.assertEqual(list(result), [])
 
+    def test_principals_allowed_by_permission_list_permissions(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [
+            (Deny, 'bob', ['write']),
+            (Allow, 'bob', ['read']),
+            (Allow, 'fred', ['write']),
+        ]
+        for i in range(3):
+            result = helper.principals_allowed_by_permission(context, 'read')
+            self.assertEqual(result, {'bob'})
+
     def test_principals_allowed_by_permission(self):
         from pyramid.authorization import (
             ALL_PERMISSIONS,
@@ -400,6 +414,18 @@ class TestACLHelper(unittest.TestCase):
         # ['view_stuff']
         self.assertEqual(result, False)
 
+    def test_principals_as_tuple(self):
+        from pyramid.authorization import ACLHelper, Allow, Everyone
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'wilma', 'view')]
+        principals = (Everyone, 'wilma')
+
+        result = helper.permits(root, principals, 'view')
+        self.assertTrue(result)
+        self.assertIs(result.principals, principals)
+
     def test_callable_acl(self):
         from pyramid.authorization import ACLHelper, Allow
 
@@ -410,6 +436,185 @@ class TestACLHelper(unittest.TestCase):
         result = helper.permits(context, ['bob'], 'read')
         self.assertTrue(result)
 
+    def test_acl_allows_everyone_first(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny, Everyone
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Deny, Everyone, 'view')]
+        context = DummyContext(__parent__=root)
+        context.__acl__ = ((Allow, Everyone, 'view'),)
+
+        result = helper.permits(context, [Everyone], 'view')
+        self.assertTrue(result)
+        self.assertIs(result.context, context)
+        self.assertEqual(result.ace, (Allow, Everyone, 'view'))
+
+        # Everyone must still be one of the supplied principals
+        result = helper.permits(context, ['bob'], 'view')
+        self.assertFalse(result)
+        self.assertEqual(result.ace, '<default deny>')
+
+        result = helper.permits(context, [Everyone], 'edit')
+        self.assertFalse(result)
+
+    def test_acl_fetched_once(self):
+        from pyramid.authorization import ACLHelper, Allow, Everyone
+
+        class Resource:
+            calls = 0
+
+            @property
+            def __acl__(self):
+                self.calls += 1
+                return self.acl
+
+        helper = ACLHelper()
+        context = Resource()
+        context.acl = ((Allow, Everyone, 'view'), (Allow, 'bob', 'edit'))
+        for permission in ('view', 'edit', 'view', 'edit'):
+            context.calls = 0
+            self.assertTrue(
+                helper.permits(context, [Everyone, 'bob'], permission)
+            )
+            self.assertEqual(context.calls, 1)
+
+    def test_acl_none(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'bob', 'read')]
+        context = DummyContext(__parent__=root, __acl__=None)
+        result = helper.permits(context, ['bob'], 'read')
+        self.assertTrue(result)
+        self.assertIs(result.context, root)
+        self.assertEqual(
+            helper.principals_allowed_by_permission(context, 'read'), {'bob'}
+        )
+
+    def test_acl_modified_in_place(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'bob', 'read')]
+        self.assertTrue(helper.permits(context, ['bob'], 'read'))
+        self.assertTrue(helper.permits(context, ['bob'], 'read'))
+        context.__acl__.insert(0, (Deny, 'bob', 'read'))
+        result = helper.permits(context, ['bob'], 'read')
+        self.assertFalse(result)
+        self.assertEqual(result.ace, (Deny, 'bob', 'read'))
+
+    def test_acl_list_ace_modified_in_place(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [[Allow, 'bob', 'view']]
+        for i in range(3):
+            self.assertTrue(helper.permits(context, ['bob'], 'view'))
+        context.__acl__[0][0] = Deny
+        result = helper.permits(context, ['bob'], 'view')
+        self.assertFalse(result)
+        self.assertEqual(result.ace, [Deny, 'bob', 'view'])
+        context.__acl__[0][:2] = [Allow, 'fred']
+        self.assertFalse(helper.permits(context, ['bob'], 'view'))
+        self.assertTrue(helper.permits(context, ['fred'], 'view'))
+
+    def test_acl_mutable_permissions(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        permissions = ['read']
+        context.__acl__ = ((Allow, 'bob', permissions),)
+        self.assertFalse(helper.permits(context, ['bob'], 'write'))
+        permissions.append('write')
+        self.assertTrue(helper.permits(context, ['bob'], 'write'))
+
+    def test_acl_set_permissions(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        permissions = {'read'}
+        context.__acl__ = (
+            (Allow, 'bob', permissions),
+            (Allow, 'fred', frozenset(('read', 'write'))),
+        )
+        for i in range(3):
+            self.assertTrue(helper.permits(context, ['bob'], 'read'))
+            self.assertTrue(helper.permits(context, ['fred'], 'write'))
+            self.assertFalse(helper.permits(context, ['bob'], 'write'))
+        permissions.add('write')
+        self.assertTrue(helper.permits(context, ['bob'], 'write'))
+
+    def test_acl_bad_ace(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'bob')]
+        self.assertRaises(ValueError, helper.permits, context, ['bob'], 'read')
+
+    def test_acl_bad_ace_not_reached(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'bob', 'read'), (Allow, 'bob')]
+        for i in range(3):
+            result = helper.permits(context, ['bob'], 'read')
+            self.assertTrue(result)
+            self.assertEqual(result.ace, (Allow, 'bob', 'read'))
+
+    def test_acl_unhashable_permissions(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = ((Allow, 'bob', ('read', ['write'])),)
+        for i in range(3):
+            result = helper.permits(context, ['bob'], 'edit')
+            self.assertFalse(result)
+            self.assertEqual(result.ace, '<default deny>')
+            result = helper.permits(context, ['bob'], ['write'])
+            self.assertTrue(result)
+
+    def test_acl_custom_sequence(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        class ACL(list):
+            pass
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = ACL([(Deny, 'fred', 'read'), (Allow, 'bob', 'read')])
+        for i in range(3):
+            self.assertTrue(helper.permits(context, ['bob'], 'read'))
+            self.assertFalse(helper.permits(context, ['fred'], 'read'))
+        self.assertEqual(
+            helper.principals_allowed_by_permission(context, 'read'), {'bob'}
+        )
+
+    def test_acl_property(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        class Resource:
+            def __init__(self, owner):
+                self.owner = owner
+
+            @property
+            def __acl__(self):
+                return [(Allow, self.owner, 'edit')]
+
+        helper = ACLHelper()
+        for owner in ('bob', 'fred', 'bob'):
+            context = Resource(owner)
+            self.assertTrue(helper.permits(context, [owner], 'edit'))
+            self.assertFalse(helper.permits(context, ['jim'], 'edit'))
+
     def test_principals_allowed_by_permission_direct(self):
         from pyramid.authorization import DENY_ALL, ACLHelper, Allow
 
@@ -527,6 +732,278 @@ class TestACLHelper(unittest.TestCase):
         )
         self.assertEqual(result, [])
 
+    def test_permits_many(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny, Everyone
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'fred', 'view')]
+        folder = DummyContext(__parent__=root)
+        folder.__acl__ = [(Deny, 'fred', 'edit')]
+        doc1 = DummyContext(__parent__=folder)
+        doc2 = DummyContext(__parent__=folder)
+        doc2.__acl__ = [(Deny, 'fred', 'view')]
+        other = DummyContext()
+        contexts = [doc1, doc2, folder, other]
+        principals = [Everyone, 'fred']
+
+        for permission in ('view', 'edit'):
+            results = helper.permits_many(contexts, principals, permission)
+            self.assertEqual(len(results), len(contexts))
+            for context, result in zip(contexts, results):
+                expected = helper.permits(context, principals, permission)
+                self.assertEqual(type(result), type(expected))
+                self.assertEqual(result.ace, expected.ace)
+                self.assertEqual(result.acl, expected.acl)
+                self.assertEqual(result.context, expected.context)
+                self.assertEqual(result.permission, permission)
+                self.assertEqual(result.principals, principals)
+
+    def test_permits_many_evaluates_shared_acl_once(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        calls = []
+
+        def acl():
+            calls.append(1)
+            return [(Allow, 'fred', 'view')]
+
+        helper = ACLHelper()
+        folder = DummyContext(__acl__=acl)
+        doc1 = DummyContext(__parent__=folder)
+        doc2 = DummyContext(__parent__=folder)
+        results = helper.permits_many([doc1, doc2], ['fred'], 'view')
+        self.assertEqual(results, [True, True])
+        self.assertEqual(results[0].context, folder)
+        self.assertEqual(len(calls), 1)
+
+    def test_permits_many_default_deny(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        root = DummyContext(__acl__=[(Allow, 'fred', 'view')])
+        doc1 = DummyContext(__parent__=root)
+        doc2 = DummyContext(__parent__=root)
+        results = helper.permits_many([doc1, doc2], ['bob'], 'view')
+        self.assertEqual(results, [False, False])
+        self.assertEqual(results[0].ace, '<default deny>')
+        self.assertEqual(results[0].acl, root.__acl__)
+        self.assertEqual(results[0].context, doc1)
+        self.assertEqual(results[1].context, doc2)
+
+    def test_permits_many_no_contexts(self):
+        from pyramid.authorization import ACLHelper
+
+        helper = ACLHelper()
+        self.assertEqual(helper.permits_many([], ['fred'], 'view'), [])
+
+
+class Test_get_compiled_acl(unittest.TestCase):
+    def setUp(self):
+        from pyramid import authorization
+
+        self._old = (
+            authorization._acl_cache,
+            authorization._acl_candidates,
+            authorization._ACL_CACHE_MAX,
+            authorization._ACL_CANDIDATES_MAX,
+        )
+        authorization._acl_cache = {}
+        authorization._acl_candidates = {}
+
+    def tearDown(self):
+        from pyramid import authorization
+
+        (
+            authorization._acl_cache,
+            authorization._acl_candidates,
+            authorization._ACL_CACHE_MAX,
+            authorization._ACL_CANDIDATES_MAX,
+        ) = self._old
+
+    def _callFUT(self, acl):
+        from pyramid.authorization import _get_compiled_acl
+
+        return _get_compiled_acl(acl)
+
+    def _compile(self, acl):
+        # an ACL is only compiled once it has been seen twice
+        self._callFUT(acl)
+        return self._callFUT(acl)
+
+    def test_cached(self):
+        from pyramid.authorization import Allow
+
+        acl = ((Allow, 'bob', 'read'),)
+        self.assertIsNone(self._callFUT(acl))
+        result = self._callFUT(acl)
+        self.assertEqual(
+            result.entries,
+            (((Allow, 'bob', 'read'), Allow, 'bob', {'read'}),),
+        )
+        self.assertIs(self._callFUT(acl), result)
+
+    def test_permission_containers(self):
+        from pyramid.authorization import ALL_PERMISSIONS, Allow
+
+        perms = ['read']
+        acl = (
+            (Allow, 'bob', perms),
+            (Allow, 'bob', ALL_PERMISSIONS),
+            (Allow, 'bob', 1),
+        )
+        result = self._compile(acl).entries
+        self.assertIs(result[0][3], perms)
+        self.assertIs(result[1][3], ALL_PERMISSIONS)
+        self.assertEqual(result[2][3], (1,))
+
+    def test_action_interned(self):
+        from pyramid.authorization import Allow
+
+        action = ''.join(['Al', 'low'])
+        self.assertIsNot(action, Allow)
+        result = self._compile(((action, 'bob', 'read'),)).entries
+        self.assertIs(result[0][1], Allow)
+
+    def test_permission_subclasses(self):
+        from pyramid.authorization import Allow
+
+        class Permission(str):
+            pass
+
+        class Permissions(tuple):
+            pass
+
+        permissions = Permissions(('read', 'write'))
+        acl = (
+            (Allow, 'bob', Permission('read')),
+            (Allow, 'bob', permissions),
+        )
+        result = self._compile(acl).entries
+        self.assertEqual(result[0][3], ('read',))
+        self.assertIs(result[1][3], permissions)
+
+    def test_set_permissions(self):
+        from pyramid.authorization import Allow
+
+        permissions = {'read'}
+        frozen = frozenset(('read', 'write'))
+        acl = ((Allow, 'bob', permissions), (Allow, 'fred', frozen))
+        compiled = self._compile(acl)
+        self.assertIs(compiled.entries[0][3], permissions)
+        self.assertIs(compiled.entries[1][3], frozen)
+        write = compiled.for_permission('write')
+        self.assertEqual([entry[0] for entry in write], list(acl))
+        other = compiled.for_permission('other')
+        self.assertEqual([entry[0] for entry in other], [acl[0]])
+
+    def test_malformed_ace(self):
+        from pyramid import authorization
+        from pyramid.authorization import Allow
+
+        acl = ((Allow, 'bob', 'read'), (Allow, 'bob'))
+        self.assertIsNone(self._compile(acl))
+        # the failure is remembered rather than compiling again
+        self.assertEqual(authorization._acl_cache[id(acl)][2], None)
+        self.assertIsNone(self._callFUT(acl))
+
+    def test_list_ace(self):
+        from pyramid.authorization import Allow
+
+        acl = ((Allow, 'bob', 'read'), [Allow, 'fred', 'read'])
+        self.assertIsNone(self._compile(acl))
+
+    def test_unhashable_permissions(self):
+        from pyramid.authorization import Allow
+
+        acl = ((Allow, 'bob', ('read', ['write'])),)
+        self.assertIsNone(self._compile(acl))
+
+    def test_not_list_or_tuple(self):
+        from pyramid.authorization import Allow
+
+        class ACL(list):
+            pass
+
+        acl = ACL([(Allow, 'bob', 'read')])
+        self.assertIsNone(self._compile(acl))
+
+    def test_for_permission(self):
+        from pyramid.authorization import ALL_PERMISSIONS, Allow, Deny
+
+        acl = (
+            (Allow, 'bob', 'read'),
+            (Deny, 'fred', ('read', 'write')),
+            (Allow, 'jim', ALL_PERMISSIONS),
+            (Allow, 'fred', 'write'),
+        )
+        compiled = self._compile(acl)
+        read = compiled.for_permission('read')
+        self.assertEqual([entry[0] for entry in read], list(acl[:3]))
+        self.assertIs(compiled.for_permission('read'), read)
+        write = compiled.for_permission('write')
+        self.assertEqual([entry[0] for entry in write], list(acl[1:]))
+        other = compiled.for_permission('other')
+        self.assertEqual([entry[0] for entry in other], [acl[2]])
+
+    def test_for_permission_unhashable(self):
+        from pyramid.authorization import Allow
+
+        compiled = self._compile(((Allow, 'bob', 'read'),))
+        self.assertIsNone(compiled.for_permission(['read']))
+
+    def test_for_permission_index_bounded(self):
+        from pyramid.authorization import Allow
+
+        compiled = self._compile(((Allow, 'bob', 'read'),))
+        compiled.max_indexed_permissions = 1
+        compiled.for_permission('read')
+        compiled.for_permission('write')
+        self.assertEqual(list(compiled._by_permission), ['read'])
+        self.assertEqual(compiled.for_permission('write'), ())
+
+    def test_list_modified(self):
+        from pyramid.authorization import Allow
+
+        acl = [(Allow, 'bob', 'read')]
+        result = self._compile(acl)
+        acl.append((Allow, 'fred', 'read'))
+        self.assertEqual(len(self._compile(acl).entries), 2)
+        self.assertEqual(len(result.entries), 1)
+
+    def test_evicts_oldest(self):
+        from pyramid import authorization
+        from pyramid.authorization import Allow
+
+        authorization._ACL_CACHE_MAX = 2
+        acls = [((Allow, 'bob', 'read'),) for i in range(3)]
+        for acl in acls:
+            self._compile(acl)
+        self.assertEqual(
+            list(authorization._acl_cache), [id(acls[1]), id(acls[2])]
+        )
+
+    def test_fresh_list_not_cached(self):
+        from pyramid import authorization
+        from pyramid.authorization import Allow
+
+        static = ((Allow, 'bob', 'read'),)
+        compiled = self._compile(static)
+        for i in range(authorization._ACL_CANDIDATES_MAX * 3):
+            self.assertIsNone(self._callFUT([(Allow, 'bob', 'read')]))
+        self.assertEqual(list(authorization._acl_cache), [id(static)])
+        self.assertIs(self._callFUT(static), compiled)
+
+    def test_candidates_bounded(self):
+        from pyramid import authorization
+        from pyramid.authorization import Allow
+
+        authorization._ACL_CANDIDATES_MAX = 2
+        acls = [((Allow, 'bob', 'read'),) for i in range(3)]
+        for acl in acls:
+            self._callFUT(acl)
+        self.assertEqual(list(authorization._acl_candidates), [id(acls[2])])
+
 
 class DummyContext:
     def __init__(self, *arg, **kw):
@@ -593,6 +593,20 @@ class ConfiguratorTests(unittest.TestCase):
         logger = reg.getUtility(IDebugLogger)
         self.assertEqual(logger.name, 'tests.test_config')
 
+    def test_setup_registry_debug_logger_None_shared(self):
+        import logging
+
+        from pyramid.interfaces import IDebugLogger
+        from pyramid.registry import Registry
+
+        reg = Registry()
+        config = self._makeOne(reg)
+        config.setup_registry()
+        config.setup_registry()
+        logger = reg.getUtility(IDebugLogger)
+        self.assertIs(logger, logging.getLogger('tests.test_config'))
+        self.assertEqual(logger.handlers, [])
+
     def test_setup_registry_debug_logger_non_None(self):
         from pyramid.interfaces import IDebugLogger
         from pyramid.registry import Registry
@@ -25,6 +25,52 @@ class TestRegistry(unittest.TestCase):
         registry._clear_view_lookup_cache()
         self.assertEqual(registry._view_lookup_cache, {})
 
+    def test_clear_utility_cache_lookup(self):
+        registry = self._makeOne()
+        registry._utility_lookup_cache[1] = 2
+        registry._clear_utility_lookup_cache()
+        self.assertEqual(registry._utility_lookup_cache, {})
+
+    def test_utility_lookup_cache(self):
+        registry = self._makeOne()
+        cache = registry._get_utility_lookup_cache()
+        cache[1] = 2
+        self.assertIs(registry._get_utility_lookup_cache(), cache)
+
+    def test_registerUtility_clears_utility_lookup_cache(self):
+        registry = self._makeOne()
+        registry._get_utility_lookup_cache()[1] = 2
+        registry.registerUtility(object(), IDummyEvent)
+        self.assertEqual(registry._get_utility_lookup_cache(), {})
+
+    def test_unregisterUtility_clears_utility_lookup_cache(self):
+        registry = self._makeOne()
+        dummy = object()
+        registry.registerUtility(dummy, IDummyEvent)
+        registry._get_utility_lookup_cache()[1] = 2
+        self.assertTrue(registry.unregisterUtility(dummy, IDummyEvent))
+        self.assertEqual(registry._get_utility_lookup_cache(), {})
+
+    def test_utilities_register_clears_utility_lookup_cache(self):
+        registry = self._makeOne()
+        registry._get_utility_lookup_cache()[1] = 2
+        registry.utilities.register((), IDummyEvent, '', object())
+        self.assertEqual(registry._get_utility_lookup_cache(), {})
+
+    def test_base_registerUtility_clears_utility_lookup_cache(self):
+        base = self._makeOne('base')
+        registry = self._makeOne('child', bases=(base,))
+        registry._get_utility_lookup_cache()[1] = 2
+        base.registerUtility(object(), IDummyEvent)
+        self.assertEqual(registry._get_utility_lookup_cache(), {})
+
+    def test_set_bases_clears_utility_lookup_cache(self):
+        base = self._makeOne('base')
+        registry = self._makeOne('child')
+        registry._get_utility_lookup_cache()[1] = 2
+        registry.__bases__ = (base,)
+        self.assertEqual(registry._get_utility_lookup_cache(), {})
+
     def test_package_name(self):
         package_name = 'testing'
         registry = self._makeOne(package_name)
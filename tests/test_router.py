@@ -1,3 +1,4 @@
+import logging
 import unittest
 from zope.interface import implementer
 
@@ -812,6 +813,26 @@ class TestRouter(unittest.TestCase):
             'no route matched for url http://localhost:8080/wontmatch',
         )
 
+    def test_call_route_match_miss_debug_routematch_logger_disabled(self):
+        from pyramid.httpexceptions import HTTPNotFound
+        from pyramid.interfaces import IDebugLogger
+
+        logger = DummyLogger()
+        logger.isEnabledFor = lambda level: level >= logging.INFO
+        self.registry.registerUtility(logger, IDebugLogger)
+        self._registerSettings(debug_routematch=True)
+        self._registerRouteRequest('foo')
+        self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        environ = self._makeEnviron(PATH_INFO='/wontmatch')
+        self._registerRootFactory(context)
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        self.assertRaises(HTTPNotFound, router, environ, start_response)
+
+        self.assertEqual(len(logger.messages), 0)
+
     def test_call_route_matches_doesnt_overwrite_subscriber_iface(self):
         from zope.interface import Interface, alsoProvides
 
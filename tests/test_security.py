@@ -118,6 +118,16 @@ class TestACLAllowed(unittest.TestCase):
         self.assertTrue('<ACLAllowed instance at ' in repr(allowed))
         self.assertTrue("with msg %r>" % msg in repr(allowed))
 
+    def test_attributes(self):
+        allowed = self._makeOne(
+            'ace', 'acl', 'permission', 'principals', 'ctx'
+        )
+        self.assertEqual(allowed.ace, 'ace')
+        self.assertEqual(allowed.acl, 'acl')
+        self.assertEqual(allowed.permission, 'permission')
+        self.assertEqual(allowed.principals, 'principals')
+        self.assertEqual(allowed.context, 'ctx')
+
 
 class TestACLDenied(unittest.TestCase):
     def _getTargetClass(self):
@@ -145,6 +155,19 @@ class TestACLDenied(unittest.TestCase):
         self.assertTrue('<ACLDenied instance at ' in repr(denied))
         self.assertTrue("with msg %r>" % msg in repr(denied))
 
+    def test_attributes(self):
+        denied = self._makeOne('ace', 'acl', 'permission', 'principals', 'ctx')
+        self.assertEqual(denied.ace, 'ace')
+        self.assertEqual(denied.acl, 'acl')
+        self.assertEqual(denied.permission, 'permission')
+        self.assertEqual(denied.principals, 'principals')
+        self.assertEqual(denied.context, 'ctx')
+
+    def test_attributes_assignable(self):
+        denied = self._makeOne('ace', 'acl', 'permission', 'principals', 'ctx')
+        denied.ace = 'other'
+        self.assertEqual(denied.ace, 'other')
+
 
 class TestPrincipalsAllowedByPermission(unittest.TestCase):
     def setUp(self):
@@ -175,6 +198,54 @@ class TestPrincipalsAllowedByPermission(unittest.TestCase):
         self.assertEqual(result, 'yo')
 
 
+class Test_get_security_policy(unittest.TestCase):
+    def _callFUT(self, request):
+        from pyramid.security import _get_security_policy
+
+        return _get_security_policy(request)
+
+    def test_no_security_policy(self):
+        request = _makeRequest()
+        self.assertIsNone(self._callFUT(request))
+        self.assertIsNone(self._callFUT(request))
+
+    def test_cached_until_registration_changes(self):
+        from pyramid.interfaces import ISecurityPolicy
+
+        request = _makeRequest()
+        self.assertIsNone(self._callFUT(request))
+        policy = _registerSecurityPolicy(request.registry, 'yo')
+        self.assertIs(self._callFUT(request), policy)
+        self.assertIs(
+            request.registry._utility_lookup_cache[ISecurityPolicy], policy
+        )
+        request.registry.unregisterUtility(policy, ISecurityPolicy)
+        self.assertIsNone(self._callFUT(request))
+
+    def test_policy_registered_in_base(self):
+        from pyramid.interfaces import ISecurityPolicy
+        from pyramid.registry import Registry
+
+        request = _makeRequest()
+        base = Registry('base')
+        request.registry = Registry('child', bases=(base,))
+        self.assertIsNone(self._callFUT(request))
+        policy = DummySecurityPolicy('yo')
+        base.registerUtility(policy, ISecurityPolicy)
+        self.assertIs(self._callFUT(request), policy)
+
+    def test_non_pyramid_registry(self):
+        from zope.interface.registry import Components
+
+        from pyramid.interfaces import ISecurityPolicy
+
+        request = _makeRequest()
+        request.registry = Components()
+        policy = DummySecurityPolicy('yo')
+        request.registry.registerUtility(policy, ISecurityPolicy)
+        self.assertIs(self._callFUT(request), policy)
+
+
 class TestRemember(unittest.TestCase):
     def setUp(self):
         testing.setUp()
@@ -541,6 +612,36 @@ class TestLegacySecurityPolicy(unittest.TestCase):
 
         self.assertTrue(policy.permits(request, request.context, 'permission'))
 
+    def test_permits_caches_principals(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn = _registerAuthenticationPolicy(request.registry, ['p1'])
+        _registerAuthorizationPolicy(request.registry, True)
+
+        policy.permits(request, request.context, 'permission')
+        authn.result = ['p2']
+        policy.permits(request, request.context, 'permission')
+        self.assertEqual(policy._principals_cache.get(request), ['p1'])
+
+        policy.remember(request, 'userid')
+        policy.permits(request, request.context, 'permission')
+        self.assertEqual(policy._principals_cache.get(request), ['p2'])
+
+    def test_authenticated_userid_cached(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn = _registerAuthenticationPolicy(request.registry, 'userid')
+
+        self.assertEqual(policy.authenticated_userid(request), 'userid')
+        authn.result = 'other'
+        self.assertEqual(policy.authenticated_userid(request), 'userid')
+        policy.forget(request)
+        self.assertEqual(policy.authenticated_userid(request), 'other')
+
 
 _TEST_HEADER = 'X-Pyramid-Test'
 
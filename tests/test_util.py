@@ -900,6 +900,53 @@ class Dummy:
     pass
 
 
+class Test_is_nonstr_iter(unittest.TestCase):
+    def _callFUT(self, v):
+        from pyramid.util import is_nonstr_iter
+
+        return is_nonstr_iter(v)
+
+    def test_str(self):
+        self.assertFalse(self._callFUT('abc'))
+
+    def test_builtin_containers(self):
+        for v in ([], (), set(), frozenset()):
+            self.assertTrue(self._callFUT(v))
+
+    def test_other_iterable(self):
+        self.assertTrue(self._callFUT(iter([])))
+
+    def test_str_subclass(self):
+        class Foo(str):
+            pass
+
+        self.assertFalse(self._callFUT(Foo('abc')))
+
+    def test_not_iterable(self):
+        self.assertFalse(self._callFUT(None))
+        self.assertFalse(self._callFUT(1))
+
+
+class Test_is_string_or_iterable(unittest.TestCase):
+    def _callFUT(self, v):
+        from pyramid.util import is_string_or_iterable
+
+        return is_string_or_iterable(v)
+
+    def test_str(self):
+        self.assertTrue(self._callFUT('abc'))
+
+    def test_builtin_containers(self):
+        for v in ([], (), set(), frozenset()):
+            self.assertTrue(self._callFUT(v))
+
+    def test_other_iterable(self):
+        self.assertTrue(self._callFUT(iter([])))
+
+    def test_not_iterable(self):
+        self.assertFalse(self._callFUT(None))
+
+
 class Test_is_same_domain(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import is_same_domain
@@ -627,6 +627,55 @@ class TestDeriveView(unittest.TestCase):
         request.url = 'url'
         self.assertEqual(result(None, request), response)
 
+    def test_secured_view_permits_once_per_request(self):
+        response = DummyResponse()
+        view = lambda *arg: response
+        self.config.registry.settings = dict(debug_authorization=True)
+        policy = self._registerSecurityPolicy(True)
+        calls = []
+
+        def permits(request, context, permission):
+            calls.append((context, permission))
+            return True
+
+        policy.permits = permits
+        result = self.config._derive_view(view, permission='view')
+        request = self._makeRequest()
+        context = object()
+        self.assertEqual(result(context, request), response)
+        self.assertTrue(result.__permitted__(context, request))
+        self.assertEqual(calls, [(context, 'view')])
+
+        other = object()
+        self.assertTrue(result.__permitted__(other, request))
+        self.assertTrue(result.__permitted__(context, self._makeRequest()))
+        self.assertEqual(len(calls), 3)
+
+    def test_secured_view_permits_after_identity_change(self):
+        from pyramid.security import forget, remember
+
+        view = lambda *arg: DummyResponse()
+        policy = self._registerSecurityPolicy(False)
+
+        def remember_(request, userid):
+            policy.permitted = True
+            return []
+
+        def forget_(request):
+            policy.permitted = False
+            return []
+
+        policy.remember = remember_
+        policy.forget = forget_
+        result = self.config._derive_view(view, permission='view')
+        request = self._makeRequest()
+        context = object()
+        self.assertFalse(result.__permitted__(context, request))
+        remember(request, 'bob')
+        self.assertTrue(result.__permitted__(context, request))
+        forget(request)
+        self.assertFalse(result.__permitted__(context, request))
+
     def test_secured_view_raises_forbidden_no_name(self):
         from pyramid.httpexceptions import HTTPForbidden
 